@@ -41,31 +41,35 @@ class InterferometerWCFClient(AbstractInterferometerClient):
         masked_ima: numpy masked array
             image or mean of the images required
         '''
+        if how_many < 1:
+            raise ValueError('how_many must be at least 1, got %d' % how_many)
         if how_many == 1:
             width, height, pixel_size_in_microns, data_array = \
                 self._i4d.take_single_measurement()
             masked_ima = self._fromDataArrayToMaskedArray(
                 width, height, data_array * 632.8e-9)
         else:
-            image_list = []
+            acc = None
             for i in range(how_many):
                 width, height, pixel_size_in_microns, data_array = \
                     self._i4d.take_single_measurement()
-                masked_ima = self._fromDataArrayToMaskedArray(
-                    width, height, data_array * 632.8e-9)
-                image_list.append(masked_ima)
-            images = np.ma.dstack(image_list)
-            masked_ima = np.ma.mean(images, axis=2)
+                data = np.reshape(data_array, (width, height))
+                valid = ~np.isnan(data)
+                if acc is None:
+                    acc = np.zeros(data.shape, dtype=np.float64)
+                    cnt = np.zeros(data.shape, dtype=np.uint32)
+                np.add(acc, np.where(valid, data, 0), out=acc)
+                cnt += valid
+            np.divide(acc, np.maximum(cnt, 1), out=acc)
+            mean = acc.astype(data_array.dtype)
+            mean *= 632.8e-9
+            masked_ima = np.ma.masked_array(mean, mask=(cnt == 0))
 
         return masked_ima
 
     def _fromDataArrayToMaskedArray(self, width, height, data_array):
-        data = np.reshape(data_array, (width, height))
-        idx, idy = np.where(np.isnan(data))
-        mask = np.zeros((data.shape[0], data.shape[1]))
-        mask[idx, idy] = 1
-        masked_ima = np.ma.masked_array(data, mask=mask.astype(bool))
-        return masked_ima
+        data = np.reshape(np.ascontiguousarray(data_array), (width, height))
+        return np.ma.masked_array(data, mask=np.isnan(data), copy=False)
 
     @override
     def status(self):
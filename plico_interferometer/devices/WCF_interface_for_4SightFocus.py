@@ -1,6 +1,9 @@
+import http.client
 import json
 import numpy as np
-import urllib
+import select
+import socket
+import urllib.parse
 
 #I4D_IP = '10.1.20.76'
 #I4D_PORT = 8011
@@ -18,6 +21,7 @@ class WCFInterfacer():
         self._dataServiceAddress = 'http://%s:%i/DataService/' % (self._ip, self._port)
         self._systemServiceAddress = 'http://%s:%i/SystemService/' % (self._ip, self._port)
         self._frameBurstServiceAddress = 'http://%s:%i/FrameBurstService/' % (self._ip, self._port)
+        self._connection = http.client.HTTPConnection(self._ip, self._port, timeout=5)
 
     def _ping(self, host):
         import platform
@@ -26,7 +30,10 @@ class WCFInterfacer():
         command = ['ping', param, '1', host]
         if subprocess.call(command) != 0:
             raise HostNotFoundException('Interferometer PC did not ansewer to ping!')
-        
+
+    def close(self):
+        """ Close the connection to the server, if open """
+        self._connection.close()
 
     def _readJsonData(self, url, data=None):
         """
@@ -43,6 +50,7 @@ class WCFInterfacer():
         json_data:
 
         """
+        path = urllib.parse.urlsplit(url).path
         if data:
             dumped_data = json.dumps(data)
             encoded_data = dumped_data.encode('utf-8')
@@ -50,25 +58,78 @@ class WCFInterfacer():
             request_headers = {'Content-type': 'application/json',
                             'Accept': 'application/json',
                             'Content-length': content_length}
-            req = urllib.request.Request(url, data=encoded_data, headers=request_headers)
+            method = 'POST'
         else:
-            req = url
+            encoded_data = None
+            request_headers = {}
+            method = 'GET'
         try:
+            status, response_contents = self._request(
+                method, path, encoded_data, request_headers)
+        except (OSError, http.client.HTTPException) as error:
+            self._ping(self._ip)
+            raise Exception('Error = %s' %str(error))
+
+        if status >= 400:
+            raise ResponseErrorException(
+                'Response error %d: %s' % (
+                    status, response_contents.decode('utf-8', errors='replace')))
+        if response_contents != b'':
+            json_data = json.loads(response_contents)
+            return json_data
+
+    def _request(self, method, path, body, headers):
+        """
+        Send the request on the persistent HTTP connection, so that
+        consecutive calls do not pay a new TCP handshake each.
+
+        If a reused connection turns out to be closed by the server, the
+        request is sent again on a new connection only when the server
+        cannot have acted on it: the send itself failed, or it is a GET.
+        POSTs that may have reached the server are never resent.
+
+        Returns
+        -------
+        status: int
+            HTTP status code
+        contents: bytes
+            response body
+        """
+        for attempt in range(2):
+            reused = self._connectIfNeeded()
+            sent = False
             try:
-                response = urllib.request.urlopen(req, timeout=5)
-            except urllib.request.URLError as error:
-                self._ping(self._ip)
-                raise Exception('Error = %s' %str(error))
-
-            response_contents = response.read()
-            if response_contents != b'':
-                json_data = json.loads(response_contents)
-                return json_data
-        except urllib.request.HTTPError as e:
-            error_message = e.read()
-            print(error_message)
-            open('/tmp/out.html','w+').write(error_message.decode('utf-8'))
-            raise Exception('Response error see /tmp/out.html for details')
+                self._connection.request(method, path, body, headers)
+                sent = True
+                response = self._connection.getresponse()
+                return response.status, response.read()
+            except ConnectionError:
+                self._connection.close()
+                if attempt or not reused or (sent and method != 'GET'):
+                    raise
+            except (OSError, http.client.HTTPException):
+                self._connection.close()
+                raise
+
+    def _connectIfNeeded(self):
+        """
+        Returns
+        -------
+        reused: bool
+            True if an already open connection is going to be used
+        """
+        sock = self._connection.sock
+        if sock is not None:
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return True
+            # an idle keep-alive socket is readable only if the server
+            # closed it (or sent garbage): start over on a new one
+            self._connection.close()
+        self._connection.connect()
+        self._connection.sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return False
 
     ### DATA PROXY ###
     def get_feature_analysis_results(self):
@@ -406,4 +467,7 @@ class WCFInterfacer():
         self._readJsonData(url, data)
 
 class HostNotFoundException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class ResponseErrorException(Exception):
+    pass
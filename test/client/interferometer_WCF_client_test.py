@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+from plico_interferometer.client.interferometer_WCF_client import \
+    InterferometerWCFClient
+
+
+class FakeWCFInterfacer(object):
+
+    def __init__(self, frames):
+        self._frames = list(frames)
+        self.n_measurements = 0
+
+    def take_single_measurement(self):
+        data = self._frames[self.n_measurements % len(self._frames)]
+        self.n_measurements += 1
+        width, height = data.shape
+        return width, height, 1, data.flatten().astype(np.float32)
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        self.frame1 = np.array([[1., 2., np.nan],
+                                [4., np.nan, 6.]])
+        self.frame2 = np.array([[3., 4., np.nan],
+                                [6., 5., 8.]])
+        self.client = InterferometerWCFClient('localhost', 8011)
+        self.fake = FakeWCFInterfacer([self.frame1, self.frame2])
+        self.client._i4d = self.fake
+
+    def test_single_wavefront(self):
+        wf = self.client.wavefront()
+        self.assertEqual(self.fake.n_measurements, 1)
+        self.assertEqual(wf.shape, (2, 3))
+        np.testing.assert_array_equal(
+            wf.mask, [[False, False, True], [False, True, False]])
+        np.testing.assert_allclose(wf[0, 1], 2 * 632.8e-9, rtol=1e-6)
+
+    def test_averaged_wavefront(self):
+        wf = self.client.wavefront(how_many=2)
+        self.assertEqual(self.fake.n_measurements, 2)
+        np.testing.assert_array_equal(
+            wf.mask, [[False, False, True], [False, False, False]])
+        want = np.array([[2., 3., 0.],
+                         [5., 5., 7.]]) * 632.8e-9
+        np.testing.assert_allclose(wf.filled(0), want, rtol=1e-6)
+
+    def test_wavefront_rejects_non_positive_how_many(self):
+        self.assertRaises(ValueError, self.client.wavefront, how_many=0)
+        self.assertEqual(self.fake.n_measurements, 0)
+
+    def test_wavefront_keeps_frame_dtype(self):
+        self.assertEqual(self.client.wavefront().dtype, np.float32)
+        self.assertEqual(self.client.wavefront(how_many=2).dtype, np.float32)
+
+
+if __name__ == "__main__":
+    unittest.main()
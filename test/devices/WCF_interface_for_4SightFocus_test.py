@@ -0,0 +1,120 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from plico_interferometer.devices.WCF_interface_for_4SightFocus import \
+    WCFInterfacer, ResponseErrorException
+
+
+class FakeWCFHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    requests = []
+    close_after_reply = False
+    drop_next_request = False
+    error_status = None
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        FakeWCFHandler.connections += 1
+
+    def do_GET(self):
+        FakeWCFHandler.requests.append(('GET', self.path))
+        if self._dropped():
+            return
+        self._reply({'SystemSerialNumber': 'pippo'})
+
+    def do_POST(self):
+        length = int(self.headers['Content-length'])
+        body = json.loads(self.rfile.read(length))
+        FakeWCFHandler.requests.append(('POST', self.path))
+        if self._dropped():
+            return
+        self._reply(body)
+
+    def _dropped(self):
+        if FakeWCFHandler.drop_next_request:
+            FakeWCFHandler.drop_next_request = False
+            self.close_connection = True
+            return True
+        return False
+
+    def _reply(self, answer):
+        if FakeWCFHandler.error_status is not None:
+            self.send_response(FakeWCFHandler.error_status)
+            body = b'<html>bad \xff request</html>'
+        else:
+            self.send_response(200)
+            body = json.dumps(answer).encode('utf-8')
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = FakeWCFHandler.close_after_reply
+
+    def log_message(self, *args):
+        pass
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        FakeWCFHandler.connections = 0
+        FakeWCFHandler.requests = []
+        FakeWCFHandler.close_after_reply = False
+        FakeWCFHandler.drop_next_request = False
+        FakeWCFHandler.error_status = None
+        self.server = HTTPServer(('127.0.0.1', 0), FakeWCFHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.i4d = WCFInterfacer('127.0.0.1', self.server.server_port)
+        self.i4d._ping = lambda host: None
+
+    def tearDown(self):
+        self.i4d.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def _post(self, command, data):
+        url = '%s%s' % (self.i4d._dataServiceAddress, command)
+        return self.i4d._readJsonData(url, data)
+
+    def test_connection_is_reused(self):
+        for i in range(3):
+            self.assertEqual(self.i4d.get_system_info(), 'pippo')
+        self.assertEqual(FakeWCFHandler.connections, 1)
+
+    def test_post_json(self):
+        self.assertEqual(self._post('Echo', {'a': 1}), {'a': 1})
+
+    def test_reconnects_when_server_closes_idle_connection(self):
+        FakeWCFHandler.close_after_reply = True
+        self.i4d.get_system_info()
+        self.assertEqual(self.i4d.get_system_info(), 'pippo')
+        self.assertEqual(FakeWCFHandler.connections, 2)
+
+    def test_get_is_resent_when_reused_connection_drops(self):
+        self.i4d.get_system_info()
+        FakeWCFHandler.drop_next_request = True
+        self.assertEqual(self.i4d.get_system_info(), 'pippo')
+        self.assertEqual(len(FakeWCFHandler.requests), 3)
+
+    def test_post_is_not_resent_when_connection_drops(self):
+        self.i4d.get_system_info()
+        FakeWCFHandler.drop_next_request = True
+        self.assertRaises(Exception, self._post, 'Echo', {'a': 1})
+        posts = [r for r in FakeWCFHandler.requests if r[0] == 'POST']
+        self.assertEqual(len(posts), 1)
+
+    def test_error_status_raises_with_status_and_body(self):
+        FakeWCFHandler.error_status = 500
+        with self.assertRaises(ResponseErrorException) as cm:
+            self.i4d.get_system_info()
+        self.assertIn('500', str(cm.exception))
+        self.assertIn('bad', str(cm.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()